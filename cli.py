@@ -0,0 +1,168 @@
+"""
+Single entry point for the project.
+
+    python cli.py fetch                        # load_data.py: 수집 + 병합
+    python cli.py aggregate [--chunksize N]    # 청크 단위 스트리밍 통계
+    python cli.py analyze [q2 ...] [--cached]  # process_data.py (또는 저장된 결과 출력)
+    python cli.py plot                         # viz_result.py
+    python cli.py bench                        # 시작 시간 / lazy import 예산 검사
+
+Only the standard library is imported at module load; each subcommand imports
+pandas, SciPy, matplotlib etc. when it runs, so `analyze --cached` and `--help`
+start without paying for them. `bench` measures and enforces those budgets.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parent
+RESULTS_PATH = Path("data/analysis_results.json")
+MERGED_PATH = Path("data/merged_sampled.csv")
+
+# 가벼운 명령의 cold start 예산 (ms, 새 인터프리터 기준, 반복 중 최솟값)
+STARTUP_BUDGETS_MS: Dict[str, float] = {
+    "--help": 300,
+    "analyze q2 --cached": 300,
+}
+# import 시점에 불러오면 안 되는 무거운 모듈
+LAZY_IMPORTS: Dict[str, List[str]] = {
+    "cli": ["pandas", "numpy", "scipy", "matplotlib", "seaborn", "bs4"],
+    "utils": ["scipy"],
+    "viz_result": ["matplotlib", "seaborn", "scipy"],
+    "loaders.load_data_from_web": ["bs4"],
+}
+
+
+def select_results(results: Dict[str, object], names: Sequence[str]) -> Dict[str, object]:
+    if not names:
+        return results
+    selected = {}
+    for name in names:
+        matches = {k: v for k, v in results.items() if k == name or k.startswith(f"{name}_")}
+        if not matches:
+            raise SystemExit(f"알 수 없는 질문: {name}")
+        selected.update(matches)
+    return selected
+
+
+def cmd_fetch(args: argparse.Namespace) -> int:
+    import load_data
+
+    load_data.main()
+    return 0
+
+
+def cmd_aggregate(args: argparse.Namespace) -> int:
+    from streaming import analyze_stream
+    from utils import json_safe
+
+    results = analyze_stream(args.input, chunksize=args.chunksize, compression=args.compression)
+    text = json.dumps(json_safe(select_results(results, args.questions)), indent=2, ensure_ascii=False, allow_nan=False)
+    if args.out:
+        Path(args.out).write_text(text, encoding="utf-8")
+        print(f"스트리밍 집계 저장: {args.out}")
+    else:
+        print(text)
+    return 0
+
+
+def cmd_analyze(args: argparse.Namespace) -> int:
+    if not args.cached:
+        import process_data
+
+        process_data.main(jobs=args.jobs, use_cache=not args.no_cache)
+    if args.cached or args.questions:
+        if not RESULTS_PATH.exists():
+            print(f"결과 파일이 없습니다: {RESULTS_PATH} (먼저 analyze 실행)", file=sys.stderr)
+            return 1
+        results = json.loads(RESULTS_PATH.read_text(encoding="utf-8"))
+        print(json.dumps(select_results(results, args.questions), indent=2, ensure_ascii=False, allow_nan=False))
+    return 0
+
+
+def cmd_plot(args: argparse.Namespace) -> int:
+    import viz_result
+
+    viz_result.main()
+    return 0
+
+
+def measure_startup(command: str, repeat: int) -> float:
+    argv = [sys.executable, str(ROOT / "cli.py")] + command.split()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(argv, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def loaded_heavy_modules(module: str, heavy: Sequence[str]) -> List[str]:
+    code = (
+        f"import sys, json, {module}; "
+        f"print(json.dumps([m for m in {list(heavy)!r} if m in sys.modules]))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=False)
+    if out.returncode != 0:
+        return [f"<import 실패: {out.stderr.strip().splitlines()[-1] if out.stderr.strip() else out.returncode}>"]
+    return json.loads(out.stdout)
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    failures = 0
+    print("[cold start]")
+    for command, budget in STARTUP_BUDGETS_MS.items():
+        elapsed = measure_startup(command, args.repeat)
+        ok = elapsed <= budget
+        failures += not ok
+        print(f"  {'OK  ' if ok else 'FAIL'} cli.py {command:<24} {elapsed:7.1f} ms (예산 {budget:.0f} ms)")
+    print("[lazy imports]")
+    for module, heavy in LAZY_IMPORTS.items():
+        loaded = loaded_heavy_modules(module, heavy)
+        failures += bool(loaded)
+        print(f"  {'FAIL' if loaded else 'OK  '} import {module:<28} {', '.join(loaded) if loaded else '-'}")
+    return 1 if failures else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="Steam 게임 데이터 수집/분석 CLI")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("fetch", help="리뷰/API/웹 데이터 수집 후 merged_sampled.csv 생성")
+    p.set_defaults(func=cmd_fetch)
+
+    p = sub.add_parser("aggregate", help="CSV를 청크 단위로 읽어 스트리밍 통계 계산")
+    p.add_argument("questions", nargs="*", help="출력할 질문 (예: q2 q3), 생략 시 전체")
+    p.add_argument("--input", default=str(MERGED_PATH))
+    p.add_argument("--chunksize", type=int, default=50_000)
+    p.add_argument("--compression", type=float, default=500, help="t-digest 압축 계수")
+    p.add_argument("--out", default=None, help="결과 JSON 저장 경로 (생략 시 출력)")
+    p.set_defaults(func=cmd_aggregate)
+
+    p = sub.add_parser("analyze", help="6개 질문 분석 (analysis_results.json)")
+    p.add_argument("questions", nargs="*", help="출력할 질문 (예: q2), 생략 시 전체")
+    p.add_argument("--cached", action="store_true", help="재계산 없이 저장된 결과만 출력")
+    p.add_argument("--jobs", type=int, default=None, help="질문 병렬 실행 프로세스 수")
+    p.add_argument("--no-cache", action="store_true", help="질문 결과 캐시 무시")
+    p.set_defaults(func=cmd_analyze)
+
+    p = sub.add_parser("plot", help="분석 그래프 저장 (data/plots)")
+    p.set_defaults(func=cmd_plot)
+
+    p = sub.add_parser("bench", help="cold start 시간과 lazy import 예산 검사")
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
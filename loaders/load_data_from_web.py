@@ -2,7 +2,6 @@ from typing import Iterable, Optional, Dict, List
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 STEAMDB_INFO = "https://steamdb.info/app/{app_id}/info/"
 STEAMDB_PRICE = "https://steamdb.info/app/{app_id}/price/"
@@ -22,6 +21,8 @@ def _parse_date(text: Optional[str]) -> Optional[pd.Timestamp]:
 def _fetch_ea_info(app_id: int, session: requests.Session, delay: float) -> Dict[str, object]:
     import time
 
+    from bs4 import BeautifulSoup
+
     url = STEAMDB_INFO.format(app_id=app_id)
     resp = session.get(url, timeout=20)
     resp.raise_for_status()
@@ -44,6 +45,8 @@ def _fetch_ea_info(app_id: int, session: requests.Session, delay: float) -> Dict
 def _fetch_price_history(app_id: int, session: requests.Session, delay: float) -> Dict[str, object]:
     import time
 
+    from bs4 import BeautifulSoup
+
     url = STEAMDB_PRICE.format(app_id=app_id)
     resp = session.get(url, timeout=20)
     resp.raise_for_status()
@@ -83,6 +86,8 @@ def _fetch_price_history(app_id: int, session: requests.Session, delay: float) -
 def _fetch_patchnotes(app_id: int, session: requests.Session, delay: float) -> Dict[str, object]:
     import time
 
+    from bs4 import BeautifulSoup
+
     url = STEAMDB_PATCH.format(app_id=app_id)
     resp = session.get(url, timeout=20)
     resp.raise_for_status()
@@ -114,6 +119,8 @@ def _fetch_patchnotes(app_id: int, session: requests.Session, delay: float) -> D
 def _fetch_community_posts(app_id: int, session: requests.Session, delay: float) -> Dict[str, object]:
     import time
 
+    from bs4 import BeautifulSoup
+
     url = STEAM_COMMUNITY_DISCUSS.format(app_id=app_id)
     resp = session.get(url, timeout=20)
     resp.raise_for_status()
@@ -2,13 +2,20 @@
 Answer 6 developer-oriented questions using merged_sampled.csv.
 
 Each question has one function. Results are saved to data/analysis_results.json.
+Questions run in parallel through runner.run_questions; unchanged ones are
+served from the on-disk cache (data/cache/questions).
+With --stream the CSV is processed in chunks by streaming.analyze_stream
+instead (constant memory, error bounds documented in streaming.py).
 """
+import argparse
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
+from runner import run_questions
+from streaming import DEFAULT_CHUNKSIZE, analyze_stream
 from utils import add_features, cohen_d, load_merged, mannwhitney_p, simple_regression
 
 
@@ -76,18 +83,46 @@ QUESTION_FUNCS = [
     q6_scale_effect_on_sentiment,
 ]
 
-
-def main() -> None:
-    df_raw = load_merged()
-    df = add_features(df_raw)
+# 각 질문이 읽는 feature 컬럼 (캐시 키와 공유 메모리 대상)
+QUESTION_COLUMNS: Dict[str, List[str]] = {
+    "q1_optimal_price_bucket": ["price_bucket", "positive_ratio"],
+    "q2_review_speed_targets": ["reviews_per_day_90d"],
+    "q3_engagement_targets": ["engagement_ratio"],
+    "q4_price_effect_on_sentiment": ["log_price", "positive_ratio"],
+    "q5_playtime_effect_on_sentiment": ["avg_playtime", "positive_ratio"],
+    "q6_scale_effect_on_sentiment": ["owners_median", "positive_ratio"],
+}
+
+
+def main(
+    stream: bool = False,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
+) -> None:
     results: Dict[str, object] = {}
-    for func in QUESTION_FUNCS:
-        results[func.__name__] = func(df)
+    if stream:
+        results.update(analyze_stream("data/merged_sampled.csv", chunksize=chunksize))
+    else:
+        df_raw = load_merged()
+        df = add_features(df_raw)
+        answers, cached = run_questions(df, QUESTION_FUNCS, QUESTION_COLUMNS, jobs=jobs, use_cache=use_cache)
+        results.update(answers)
+        print(f"캐시 사용: {len(cached)}개, 재계산: {len(answers) - len(cached)}개")
     out_path = Path("data/analysis_results.json")
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    pd.Series(results).to_json(out_path, indent=2, force_ascii=False)
+    # 쿼리 서비스가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체한다
+    tmp_path = out_path.with_suffix(".tmp")
+    pd.Series(results).to_json(tmp_path, indent=2, force_ascii=False)
+    tmp_path.replace(out_path)
     print(f"분석 결과 저장: {out_path}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stream", action="store_true", help="청크 단위 스트리밍 통계로 분석 (메모리 일정)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--jobs", type=int, default=None, help="질문 병렬 실행 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--no-cache", action="store_true", help="결과 캐시를 무시하고 모두 재계산")
+    args = parser.parse_args()
+    main(stream=args.stream, chunksize=args.chunksize, jobs=args.jobs, use_cache=not args.no_cache)
@@ -0,0 +1,299 @@
+"""
+Long-lived local HTTP query service over the feature frame and the Q1~Q6 results.
+
+The merged CSV is loaded and featurized once. Rows are rolled up into a cell table
+(currency x owners tier x release year x release price) with per-metric count/mean/M2,
+sorted by price, so a filtered query is a searchsorted slice plus a few
+vectorized masks over the cells instead of a scan over the raw rows. State is rebuilt
+whenever the source files change (mtime/size checked on every request).
+
+Endpoints (GET, JSON):
+    /health
+    /results                 all question results
+    /results/<q>             one question, e.g. /results/q2
+    /query?price_min=&price_max=&year_min=&year_max=&currency=&owners_tier=
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from streaming import RunningMoments
+from utils import add_features, json_safe, load_merged
+
+MERGED_PATH = Path("data/merged_sampled.csv")
+RESULTS_PATH = Path("data/analysis_results.json")
+METRICS = ["positive_ratio", "engagement_ratio", "reviews_per_day_90d", "avg_playtime"]
+PRICE_BINS = [0, 5, 10, 20, 60, np.inf]
+PRICE_LABELS = ["$0-5", "$5-10", "$10-20", "$20-60", "$60+"]
+UNKNOWN = "unknown"
+
+
+def owners_tier(df: pd.DataFrame) -> pd.Series:
+    """SteamSpy owners range as a label, e.g. "100000-200000"."""
+    lo = df["owners_min"] if "owners_min" in df.columns else pd.Series(np.nan, index=df.index)
+    hi = df["owners_max"] if "owners_max" in df.columns else pd.Series(np.nan, index=df.index)
+    tier = lo.map(lambda v: f"{v:.0f}", na_action="ignore") + "-" + hi.map(lambda v: f"{v:.0f}", na_action="ignore")
+    return tier.fillna(UNKNOWN)
+
+
+class QueryIndex:
+    """Group-level aggregates of the feature frame, sorted by release price."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        keys = pd.DataFrame(
+            {
+                "currency": df["currency"].fillna(UNKNOWN) if "currency" in df.columns else UNKNOWN,
+                "owners_tier": owners_tier(df),
+                "release_year": df["release_date"].dt.year,
+                "release_price": df["release_price"],
+            },
+            index=df.index,
+        )
+        parts = {"rows": keys.groupby(list(keys.columns), dropna=False).size()}
+        for metric in METRICS:
+            values = df[metric] if metric in df.columns else pd.Series(np.nan, index=df.index)
+            grouped = values.groupby([keys[c] for c in keys.columns], dropna=False)
+            count = grouped.count()
+            parts[f"{metric}_n"] = count
+            parts[f"{metric}_mean"] = grouped.mean().fillna(0.0)
+            parts[f"{metric}_m2"] = (grouped.var(ddof=0) * count).fillna(0.0)
+        cells = pd.DataFrame(parts).reset_index().sort_values("release_price", kind="mergesort", na_position="last")
+
+        self.n_rows = len(df)
+        self.price = cells["release_price"].to_numpy(dtype=float)
+        self.n_priced = int(np.count_nonzero(~np.isnan(self.price)))
+        self.year = cells["release_year"].to_numpy(dtype=float)
+        self.currency_codes, self.currencies = self._encode(cells["currency"])
+        self.tier_codes, self.tiers = self._encode(cells["owners_tier"])
+        bucket = pd.cut(cells["release_price"], bins=PRICE_BINS, labels=PRICE_LABELS)
+        self.bucket_codes = bucket.cat.codes.to_numpy()
+        self.aggregates = {c: cells[c].to_numpy(dtype=float) for c in parts}
+
+    @staticmethod
+    def _encode(col: pd.Series) -> Tuple[np.ndarray, Dict[str, int]]:
+        codes, uniques = pd.factorize(col.astype(str))
+        return codes, {v: i for i, v in enumerate(uniques)}
+
+    def _select(
+        self,
+        price_min: Optional[float],
+        price_max: Optional[float],
+        year_min: Optional[int],
+        year_max: Optional[int],
+        currency: Optional[str],
+        tier: Optional[str],
+    ) -> Tuple[slice, np.ndarray]:
+        lo, hi = 0, len(self.price)
+        if price_min is not None or price_max is not None:
+            # 가격 필터가 있으면 가격 결측 셀(정렬상 맨 뒤)은 제외
+            priced = self.price[: self.n_priced]
+            lo = 0 if price_min is None else int(np.searchsorted(priced, price_min, side="left"))
+            hi = self.n_priced if price_max is None else int(np.searchsorted(priced, price_max, side="right"))
+        window = slice(lo, max(lo, hi))
+        mask = np.ones(window.stop - window.start, dtype=bool)
+        if year_min is not None:
+            mask &= self.year[window] >= year_min
+        if year_max is not None:
+            mask &= self.year[window] <= year_max
+        if currency is not None:
+            mask &= self.currency_codes[window] == self.currencies.get(currency, -1)
+        if tier is not None:
+            mask &= self.tier_codes[window] == self.tiers.get(tier, -1)
+        return window, mask
+
+    @staticmethod
+    def _summary(n: np.ndarray, mean: np.ndarray, m2: np.ndarray) -> Dict[str, Optional[float]]:
+        # 선택된 셀들의 (count, mean, M2) 를 Chan 공식으로 합친다 (streaming.RunningMoments 와 동일)
+        moments = RunningMoments()
+        moments.count = int(n.sum())
+        if moments.count:
+            moments.mean = float((n * mean).sum() / moments.count)
+            moments.m2 = float((m2 + n * (mean - moments.mean) ** 2).sum())
+        return {
+            "count": moments.count,
+            "mean": moments.mean if moments.count else None,
+            "std": moments.std() if moments.count > 1 else None,
+        }
+
+    def query(self, **filters) -> Dict[str, object]:
+        window, mask = self._select(**filters)
+        picked = {c: arr[window][mask] for c, arr in self.aggregates.items()}
+        out: Dict[str, object] = {"games": int(picked["rows"].sum())}
+        for metric in METRICS:
+            out[metric] = self._summary(picked[f"{metric}_n"], picked[f"{metric}_mean"], picked[f"{metric}_m2"])
+        codes = self.bucket_codes[window][mask]
+        by_bucket = {}
+        for i, label in enumerate(PRICE_LABELS):
+            sel = codes == i
+            by_bucket[label] = {
+                "games": int(picked["rows"][sel].sum()),
+                "positive_ratio": self._summary(
+                    picked["positive_ratio_n"][sel],
+                    picked["positive_ratio_mean"][sel],
+                    picked["positive_ratio_m2"][sel],
+                ),
+            }
+        out["by_price_bucket"] = by_bucket
+        return out
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_results(df: pd.DataFrame, results_path: Path) -> Dict[str, object]:
+    if results_path.exists():
+        return json.loads(results_path.read_text(encoding="utf-8"))
+    from process_data import QUESTION_COLUMNS, QUESTION_FUNCS
+    from runner import run_questions
+
+    results, _ = run_questions(df, QUESTION_FUNCS, QUESTION_COLUMNS, jobs=1)
+    return results
+
+
+class QueryState:
+    """Feature frame index and question results, reloaded when the source files change."""
+
+    def __init__(self, merged_path: Path = MERGED_PATH, results_path: Path = RESULTS_PATH) -> None:
+        self.merged_path = merged_path
+        self.results_path = results_path
+        self._lock = threading.Lock()
+        self._signature = None
+        self.index: Optional[QueryIndex] = None
+        self.results: Dict[str, object] = {}
+        self.loaded_at = 0.0
+        self.error: Optional[str] = None
+        self._failed_signature = None
+
+    def refresh(self) -> "QueryState":
+        signature = (_file_signature(self.merged_path), _file_signature(self.results_path))
+        if signature in (self._signature, self._failed_signature):
+            return self
+        with self._lock:
+            if signature in (self._signature, self._failed_signature):
+                return self
+            # 파일이 쓰는 중이라 읽기에 실패하면 마지막으로 성공한 상태를 유지하고,
+            # 파일이 다시 바뀌면 재시도한다
+            try:
+                df = add_features(load_merged(self.merged_path))
+                index = QueryIndex(df)
+                results = _load_results(df, self.results_path)
+            except Exception as e:
+                self._failed_signature = signature
+                self.error = f"{type(e).__name__}: {e}"
+                print(f"[query_service] 데이터 로드 실패 (이전 상태 유지): {self.error}")
+                return self
+            self.index, self.results = index, results
+            self._signature = signature
+            self._failed_signature = None
+            self.error = None
+            self.loaded_at = time.time()
+            print(f"[query_service] 데이터 로드: {index.n_rows}행")
+        return self
+
+    def find_result(self, name: str) -> Optional[Tuple[str, object]]:
+        for key, value in self.results.items():
+            if key == name or key.startswith(f"{name}_"):
+                return key, value
+        return None
+
+
+def parse_filters(params: Dict[str, List[str]]) -> Dict[str, object]:
+    def one(name: str) -> Optional[str]:
+        values = params.get(name)
+        return values[-1] if values and values[-1] != "" else None
+
+    def number(name: str, cast):
+        raw = one(name)
+        if raw is None:
+            return None
+        try:
+            return cast(raw)
+        except ValueError:
+            raise ValueError(f"{name} 값이 올바르지 않습니다: {raw!r}")
+
+    return {
+        "price_min": number("price_min", float),
+        "price_max": number("price_max", float),
+        "year_min": number("year_min", int),
+        "year_max": number("year_max", int),
+        "currency": one("currency"),
+        "tier": one("owners_tier"),
+    }
+
+
+def make_handler(state: QueryState):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, payload: object) -> None:
+            body = json.dumps(json_safe(payload), ensure_ascii=False, allow_nan=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            parts = [p for p in url.path.split("/") if p]
+            state.refresh()
+            if state.index is None:
+                self._send(503, {"error": f"데이터를 불러오지 못했습니다: {state.error}"})
+            elif parts == ["health"]:
+                self._send(
+                    200,
+                    {"status": "ok", "rows": state.index.n_rows, "loaded_at": state.loaded_at, "reload_error": state.error},
+                )
+            elif parts == ["results"]:
+                self._send(200, state.results)
+            elif len(parts) == 2 and parts[0] == "results":
+                found = state.find_result(parts[1])
+                if found is None:
+                    self._send(404, {"error": f"알 수 없는 질문: {parts[1]}"})
+                else:
+                    self._send(200, {found[0]: found[1]})
+            elif parts == ["query"]:
+                try:
+                    filters = parse_filters(parse_qs(url.query))
+                except ValueError as e:
+                    self._send(400, {"error": str(e)})
+                    return
+                self._send(200, state.index.query(**filters))
+            else:
+                self._send(404, {"error": f"알 수 없는 경로: {url.path}"})
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return Handler
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, state: Optional[QueryState] = None) -> None:
+    state = (state or QueryState()).refresh()
+    server = ThreadingHTTPServer((host, port), make_handler(state))
+    print(f"[query_service] http://{host}:{port} 에서 대기 중")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    serve(args.host, args.port)
@@ -0,0 +1,208 @@
+"""
+Parallel, disk-cached runner for the question functions in process_data.py.
+
+Each question declares the feature columns it reads. A result is cached on disk
+under a key built from those columns' contents and the source of the function
+plus every project helper it calls (e.g. utils.simple_regression), so an
+unchanged question is served from cache and only changed ones are recomputed.
+Recomputed questions run in a process pool; the feature columns are placed in
+shared memory once and every worker maps them instead of receiving pickled copies.
+"""
+import hashlib
+import inspect
+import json
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = Path("data/cache/questions")
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+QuestionFunc = Callable[[pd.DataFrame], object]
+
+
+def _to_json_value(obj: object) -> object:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"JSON 직렬화 불가: {type(obj)!r}")
+
+
+def _is_project_function(obj: object) -> bool:
+    if not inspect.isfunction(obj):
+        return False
+    path = inspect.getsourcefile(obj)
+    return path is not None and PROJECT_ROOT in Path(path).resolve().parents
+
+
+def _code_names(code) -> List[str]:
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names.extend(_code_names(const))
+    return names
+
+
+def dependency_sources(func: QuestionFunc) -> List[str]:
+    """Source of func and of every project-level function it (transitively) references."""
+    seen = {}
+    stack = [func]
+    while stack:
+        current = stack.pop()
+        # __main__ 으로 실행해도 키가 같도록 모듈 이름 대신 파일 이름을 쓴다
+        key = f"{Path(inspect.getsourcefile(current)).name}:{current.__qualname__}"
+        if key in seen:
+            continue
+        seen[key] = inspect.getsource(current)
+        for name in _code_names(current.__code__):
+            obj = current.__globals__.get(name)
+            if _is_project_function(obj):
+                stack.append(obj)
+    return [seen[k] for k in sorted(seen)]
+
+
+def cache_key(func: QuestionFunc, df: pd.DataFrame, columns: Sequence[str]) -> str:
+    h = hashlib.sha256()
+    for source in dependency_sources(func):
+        h.update(source.encode("utf-8"))
+    for name in columns:
+        series = df[name]
+        h.update(name.encode("utf-8"))
+        h.update(str(series.dtype).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _cache_path(cache_dir: Path, func: QuestionFunc) -> Path:
+    return cache_dir / f"{func.__name__}.json"
+
+
+def load_cached(cache_dir: Path, func: QuestionFunc, key: str) -> Tuple[bool, object]:
+    path = _cache_path(cache_dir, func)
+    if not path.exists():
+        return False, None
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False, None
+    if entry.get("key") != key:
+        return False, None
+    return True, entry.get("result")
+
+
+def store_cached(cache_dir: Path, func: QuestionFunc, key: str, result: object) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = _cache_path(cache_dir, func)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps({"key": key, "result": result}, ensure_ascii=False, default=_to_json_value),
+        encoding="utf-8",
+    )
+    tmp.replace(path)
+
+
+def _share_frame(df: pd.DataFrame, columns: Sequence[str]) -> Tuple[Dict[str, dict], List[shared_memory.SharedMemory]]:
+    """Copy columns into shared memory blocks; returns picklable specs and the blocks to unlink."""
+    specs: Dict[str, dict] = {}
+    blocks: List[shared_memory.SharedMemory] = []
+    for name in columns:
+        series = df[name]
+        spec: Dict[str, object] = {}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.cat.codes.to_numpy()
+            spec["categories"] = series.cat.categories.tolist()
+            spec["ordered"] = bool(series.cat.ordered)
+        elif pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            values = series.to_numpy(dtype=float) if series.hasnans else series.to_numpy()
+        else:
+            # 문자열 등 고정 폭이 아닌 컬럼은 공유 메모리에 올릴 수 없어 그대로 전달한다
+            specs[name] = {"series": series.reset_index(drop=True)}
+            continue
+        values = np.ascontiguousarray(values)
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        blocks.append(shm)
+        np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+        spec.update({"shm": shm.name, "dtype": values.dtype.str, "length": len(values)})
+        specs[name] = spec
+    return specs, blocks
+
+
+def _attach_frame(specs: Dict[str, dict]) -> Tuple[pd.DataFrame, List[shared_memory.SharedMemory]]:
+    data = {}
+    blocks: List[shared_memory.SharedMemory] = []
+    for name, spec in specs.items():
+        if "series" in spec:
+            data[name] = spec["series"]
+            continue
+        shm = shared_memory.SharedMemory(name=spec["shm"])
+        blocks.append(shm)
+        values = np.ndarray((spec["length"],), dtype=np.dtype(spec["dtype"]), buffer=shm.buf)
+        if "categories" in spec:
+            data[name] = pd.Categorical.from_codes(values, categories=spec["categories"], ordered=spec["ordered"])
+        else:
+            data[name] = values
+    return pd.DataFrame(data, copy=False), blocks
+
+
+def _run_shared(func: QuestionFunc, specs: Dict[str, dict]) -> object:
+    df, blocks = _attach_frame(specs)
+    try:
+        return func(df)
+    finally:
+        del df
+        for shm in blocks:
+            shm.close()
+
+
+def run_questions(
+    df: pd.DataFrame,
+    funcs: Sequence[QuestionFunc],
+    columns: Dict[str, List[str]],
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
+    cache_dir: Path = CACHE_DIR,
+) -> Tuple[Dict[str, object], List[str]]:
+    """Run question functions, serving unchanged ones from cache.
+
+    Returns the results (in the order of funcs) and the names served from cache.
+    """
+    results: Dict[str, object] = {}
+    pending: Dict[str, Tuple[QuestionFunc, str]] = {}
+    for func in funcs:
+        key = cache_key(func, df, columns[func.__name__])
+        hit, cached = load_cached(cache_dir, func, key) if use_cache else (False, None)
+        if hit:
+            results[func.__name__] = cached
+        else:
+            pending[func.__name__] = (func, key)
+
+    computed: Dict[str, object] = {}
+    if len(pending) == 1 or jobs == 1:
+        for name, (func, _) in pending.items():
+            computed[name] = func(df[columns[name]])
+    elif pending:
+        needed = sorted({c for name in pending for c in columns[name]})
+        specs, blocks = _share_frame(df, needed)
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = {
+                    name: pool.submit(_run_shared, func, {c: specs[c] for c in columns[name]})
+                    for name, (func, _) in pending.items()
+                }
+                computed = {name: fut.result() for name, fut in futures.items()}
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+    for name, (func, key) in pending.items():
+        store_cached(cache_dir, func, key, computed[name])
+    # 캐시와 새로 계산한 결과 모두 JSON 왕복을 거친 값으로 맞춘다
+    ordered = {
+        func.__name__: json.loads(json.dumps(results.get(func.__name__, computed.get(func.__name__)), default=_to_json_value))
+        for func in funcs
+    }
+    return ordered, list(results)
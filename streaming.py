@@ -0,0 +1,366 @@
+"""
+Out-of-core version of the six questions in process_data.py.
+
+The input CSV is read in chunks and every chunk only updates small, mergeable
+sketches, so memory stays constant no matter how many rows are streamed.
+
+Error bounds compared to the in-memory answers:
+- count / mean / std / min / max (Q1~Q3), slope / intercept / r / corr (Q4~Q6),
+  Cohen's d (Q1): exact up to floating point rounding
+  (Welford/Chan updates and running co-moments).
+- Q2/Q3 percentiles: t-digest estimate. Rank error is at most about
+  pi / compression around the median (~0.6% of rows for compression=500)
+  and shrinks toward the tails; when a digest holds fewer rows than its
+  centroid budget the percentiles are exact.
+- Q1 p_value: Mann-Whitney U estimated from the bucket digests with the
+  normal approximation (continuity corrected, no tie correction).
+"""
+import math
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from utils import add_features
+
+PRICE_BUCKETS = ["$0-5", "$5-10", "$10-20", "$20-60", "$60+"]
+DESCRIBE_PERCENTILES = [0.1, 0.25, 0.5, 0.75, 0.9]
+STREAM_COLUMNS = ["release_price", "owners_median", "review_count", "avg_playtime", "positive_ratio"]
+DEFAULT_CHUNKSIZE = 50_000
+
+
+def _finite(values: Iterable[float]) -> np.ndarray:
+    arr = np.asarray(values, dtype=float)
+    return arr[~np.isnan(arr)]
+
+
+class RunningMoments:
+    """Welford mean/variance with min/max, merged with Chan's formula."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+    def update(self, values: Iterable[float]) -> None:
+        arr = _finite(values)
+        if len(arr) == 0:
+            return
+        batch = RunningMoments()
+        batch.count = len(arr)
+        batch.mean = float(arr.mean())
+        batch.m2 = float(((arr - batch.mean) ** 2).sum())
+        batch.min = float(arr.min())
+        batch.max = float(arr.max())
+        self.merge(batch)
+
+    def merge(self, other: "RunningMoments") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self, ddof: int = 1) -> float:
+        if self.count - ddof <= 0:
+            return np.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 1) -> float:
+        return math.sqrt(self.variance(ddof)) if self.count - ddof > 0 else np.nan
+
+
+class RunningCoMoments:
+    """Sufficient statistics of paired (x, y) for a least-squares line and Pearson r."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    def update(self, x: Iterable[float], y: Iterable[float]) -> None:
+        xs = np.asarray(x, dtype=float)
+        ys = np.asarray(y, dtype=float)
+        mask = ~np.isnan(xs) & ~np.isnan(ys)
+        xs, ys = xs[mask], ys[mask]
+        if len(xs) == 0:
+            return
+        batch = RunningCoMoments()
+        batch.count = len(xs)
+        batch.mean_x = float(xs.mean())
+        batch.mean_y = float(ys.mean())
+        dx = xs - batch.mean_x
+        dy = ys - batch.mean_y
+        batch.m2_x = float((dx * dx).sum())
+        batch.m2_y = float((dy * dy).sum())
+        batch.c_xy = float((dx * dy).sum())
+        self.merge(batch)
+
+    def merge(self, other: "RunningCoMoments") -> None:
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.count * other.count / total
+        self.mean_x += dx * other.count / total
+        self.mean_y += dy * other.count / total
+        self.m2_x += other.m2_x + dx * dx * weight
+        self.m2_y += other.m2_y + dy * dy * weight
+        self.c_xy += other.c_xy + dx * dy * weight
+        self.count = total
+
+    def corr(self) -> float:
+        if self.count < 2 or self.m2_x <= 0 or self.m2_y <= 0:
+            return np.nan
+        return self.c_xy / math.sqrt(self.m2_x * self.m2_y)
+
+    def regression(self) -> Dict[str, float]:
+        # utils.simple_regression 과 같은 규칙: 3개 미만이면 NaN
+        if self.count < 3 or self.m2_x <= 0:
+            return {"slope": np.nan, "intercept": np.nan, "r": np.nan}
+        slope = self.c_xy / self.m2_x
+        return {"slope": slope, "intercept": self.mean_y - slope * self.mean_x, "r": self.corr()}
+
+
+class TDigest:
+    """Merging t-digest (k1 scale function) for quantiles and CDF lookups."""
+
+    def __init__(self, compression: float = 500) -> None:
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.nan
+        self.max = np.nan
+        self._buffer = []
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum()) + sum(len(b) for b in self._buffer)
+
+    def update(self, values: Iterable[float]) -> None:
+        arr = _finite(values)
+        if len(arr) == 0:
+            return
+        self.min = float(arr.min()) if np.isnan(self.min) else min(self.min, float(arr.min()))
+        self.max = float(arr.max()) if np.isnan(self.max) else max(self.max, float(arr.max()))
+        self._buffer.append(arr)
+        if sum(len(b) for b in self._buffer) >= 5 * self.compression:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> None:
+        other._compress()
+        if len(other.means) == 0:
+            return
+        self.min = other.min if np.isnan(self.min) else min(self.min, other.min)
+        self.max = other.max if np.isnan(self.max) else max(self.max, other.max)
+        self._compress(other.means, other.weights)
+
+    def _compress(self, extra_means: Optional[np.ndarray] = None, extra_weights: Optional[np.ndarray] = None) -> None:
+        parts_m = [self.means] + self._buffer
+        parts_w = [self.weights] + [np.ones(len(b)) for b in self._buffer]
+        if extra_means is not None:
+            parts_m.append(extra_means)
+            parts_w.append(extra_weights)
+        self._buffer = []
+        means = np.concatenate(parts_m)
+        weights = np.concatenate(parts_w)
+        if len(means) == 0:
+            return
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        if len(means) <= self.compression / 2:
+            self.means, self.weights = means, weights
+            return
+        # 왼쪽 누적 분위수의 k1 값이 같은 정수 구간에 있는 항목끼리 하나의 centroid 로 묶는다
+        q_left = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q_left - 1)
+        bins = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+        merged_w = np.add.reduceat(weights, starts)
+        merged_m = np.add.reduceat(means * weights, starts) / merged_w
+        self.means, self.weights = merged_m, merged_w
+
+    def _centers(self):
+        self._compress()
+        cum = np.cumsum(self.weights)
+        # centroid 평균은 자신이 덮는 (0-기준) 순위 구간의 가운데에 놓인다
+        centers = cum - self.weights + (self.weights - 1) / 2
+        return centers, cum[-1] if len(cum) else 0.0
+
+    def quantile(self, q: float) -> float:
+        centers, total = self._centers()
+        if total == 0:
+            return np.nan
+        rank = q * (total - 1)
+        xs = np.r_[0.0, centers, total - 1]
+        ys = np.r_[self.min, self.means, self.max]
+        return float(np.interp(rank, xs, ys))
+
+    def cdf(self, x: float) -> float:
+        """Share of values below x, counting ties as half (mid-rank)."""
+        centers, total = self._centers()
+        if total == 0:
+            return np.nan
+        if x < self.min:
+            return 0.0
+        if x > self.max:
+            return 1.0
+        xs = np.r_[self.min, self.means, self.max]
+        ranks = np.r_[0.0, centers, total - 1]
+        lo = np.searchsorted(xs, x, side="left")
+        hi = np.searchsorted(xs, x, side="right")
+        if hi > lo:
+            rank = (ranks[lo:hi].min() + ranks[lo:hi].max()) / 2
+        else:
+            rank = np.interp(x, xs, ranks)
+        return float((rank + 0.5) / total)
+
+
+def mannwhitney_p_approx(digest_a: TDigest, digest_b: TDigest) -> float:
+    n_a, n_b = digest_a.count, digest_b.count
+    if n_a == 0 or n_b == 0:
+        return np.nan
+    digest_a._compress()
+    # U_a = sum over a of (#b < a + 0.5 * #b == a)
+    u = sum(w * digest_b.cdf(m) * n_b for m, w in zip(digest_a.means, digest_a.weights))
+    mu = n_a * n_b / 2
+    sigma = math.sqrt(n_a * n_b * (n_a + n_b + 1) / 12)
+    z = max(abs(u - mu) - 0.5, 0.0) / sigma
+    return min(1.0, math.erfc(z / math.sqrt(2)))
+
+
+def _pooled_cohen_d(a: RunningMoments, b: RunningMoments) -> float:
+    # utils.cohen_d 와 동일하게 한쪽 표본이 2개 미만이면 분산이 NaN 이 된다
+    if a.count < 2 or b.count < 2:
+        return np.nan
+    pooled_std = math.sqrt((a.m2 + b.m2) / (a.count + b.count - 2))
+    if pooled_std == 0:
+        return np.nan
+    return (a.mean - b.mean) / pooled_std
+
+
+def _round_or_none(value: float, digits: Optional[int] = None) -> Optional[float]:
+    # 빈 버킷 등에서 나오는 NaN 은 None 으로 돌려준다 (JSON 에서 null)
+    if np.isnan(value):
+        return None
+    return float(value) if digits is None else round(float(value), digits)
+
+
+def _describe(moments: RunningMoments, digest: TDigest, digits: int) -> Dict[str, Optional[float]]:
+    stats = {"count": float(moments.count), "mean": moments.mean if moments.count else np.nan, "std": moments.std()}
+    stats["min"] = moments.min
+    for p in DESCRIBE_PERCENTILES:
+        stats[f"{p * 100:g}%"] = digest.quantile(p)
+    stats["max"] = moments.max
+    return {k: _round_or_none(v, digits) for k, v in stats.items()}
+
+
+class StreamingAnalysis:
+    """Mergeable sketches for Q1~Q6; feed feature chunks with update()."""
+
+    def __init__(self, compression: float = 500) -> None:
+        self.compression = compression
+        # None 키: price_bucket 이 없는 행 (Q1 의 "나머지" 집합에는 포함된다)
+        self.bucket_moments: Dict[Optional[str], RunningMoments] = {b: RunningMoments() for b in PRICE_BUCKETS + [None]}
+        self.bucket_digests: Dict[Optional[str], TDigest] = {b: TDigest(compression) for b in PRICE_BUCKETS + [None]}
+        self.speed_moments = RunningMoments()
+        self.speed_digest = TDigest(compression)
+        self.engagement_moments = RunningMoments()
+        self.engagement_digest = TDigest(compression)
+        self.price_fit = RunningCoMoments()
+        self.playtime_fit = RunningCoMoments()
+        self.scale_fit = RunningCoMoments()
+
+    def update(self, df: pd.DataFrame) -> None:
+        ratio = df["positive_ratio"]
+        bucket = df["price_bucket"].astype(object).where(df["price_bucket"].notna(), None)
+        for key in self.bucket_moments:
+            sel = bucket.isna() if key is None else bucket == key
+            values = ratio[sel].to_numpy(dtype=float)
+            self.bucket_moments[key].update(values)
+            self.bucket_digests[key].update(values)
+        self.speed_moments.update(df["reviews_per_day_90d"])
+        self.speed_digest.update(df["reviews_per_day_90d"])
+        self.engagement_moments.update(df["engagement_ratio"])
+        self.engagement_digest.update(df["engagement_ratio"])
+        self.price_fit.update(df["log_price"], ratio)
+        self.playtime_fit.update(df["avg_playtime"], ratio)
+        self.scale_fit.update(df["owners_median"], ratio)
+
+    def merge(self, other: "StreamingAnalysis") -> None:
+        for key in self.bucket_moments:
+            self.bucket_moments[key].merge(other.bucket_moments[key])
+            self.bucket_digests[key].merge(other.bucket_digests[key])
+        self.speed_moments.merge(other.speed_moments)
+        self.speed_digest.merge(other.speed_digest)
+        self.engagement_moments.merge(other.engagement_moments)
+        self.engagement_digest.merge(other.engagement_digest)
+        self.price_fit.merge(other.price_fit)
+        self.playtime_fit.merge(other.playtime_fit)
+        self.scale_fit.merge(other.scale_fit)
+
+    def _q1(self) -> Dict[str, object]:
+        bucket_stats: Dict[str, Dict[str, object]] = {"mean": {}, "count": {}}
+        bucket_vs_rest = {}
+        for bucket in PRICE_BUCKETS:
+            moments = self.bucket_moments[bucket]
+            rest_moments = RunningMoments()
+            rest_digest = TDigest(self.compression)
+            for other in self.bucket_moments:
+                if other != bucket:
+                    rest_moments.merge(self.bucket_moments[other])
+                    rest_digest.merge(self.bucket_digests[other])
+            mean = _round_or_none(moments.mean, 2) if moments.count else None
+            bucket_stats["mean"][bucket] = mean
+            bucket_stats["count"][bucket] = moments.count
+            bucket_vs_rest[bucket] = {
+                "mean": mean,
+                "count": moments.count,
+                "p_value": _round_or_none(mannwhitney_p_approx(self.bucket_digests[bucket], rest_digest)),
+                "effect_size_d": _round_or_none(_pooled_cohen_d(moments, rest_moments)),
+            }
+        return {"bucket_stats": bucket_stats, "bucket_vs_rest": bucket_vs_rest}
+
+    def results(self) -> Dict[str, object]:
+        price = self.price_fit.regression()
+        playtime = self.playtime_fit.regression()
+        return {
+            "q1_optimal_price_bucket": self._q1(),
+            "q2_review_speed_targets": _describe(self.speed_moments, self.speed_digest, 4),
+            "q3_engagement_targets": _describe(self.engagement_moments, self.engagement_digest, 6),
+            "q4_price_effect_on_sentiment": {k: _round_or_none(v, 4) for k, v in price.items()},
+            "q5_playtime_effect_on_sentiment": {
+                "corr": _round_or_none(self.playtime_fit.corr(), 4),
+                "slope": _round_or_none(playtime["slope"], 6),
+                "intercept": _round_or_none(playtime["intercept"], 4),
+            },
+            "q6_scale_effect_on_sentiment": {"corr": _round_or_none(self.scale_fit.corr(), 4)},
+        }
+
+
+def analyze_stream(
+    path: Union[str, Path] = "data/merged_sampled.csv",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    compression: float = 500,
+) -> Dict[str, object]:
+    analysis = StreamingAnalysis(compression)
+    reader = pd.read_csv(path, usecols=lambda c: c in STREAM_COLUMNS, chunksize=chunksize)
+    for chunk in reader:
+        analysis.update(add_features(chunk))
+    return analysis.results()
@@ -1,9 +1,9 @@
+import math
 from pathlib import Path
 from typing import Dict, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from scipy import stats
 
 
 def load_merged(path: Union[str, Path] = "data/merged_sampled.csv") -> pd.DataFrame:
@@ -61,5 +61,20 @@ def mannwhitney_p(sample_a: pd.Series, sample_b: pd.Series) -> float:
     b = sample_b.dropna()
     if len(a) == 0 or len(b) == 0:
         return np.nan
+    from scipy import stats
+
     _, p = stats.mannwhitneyu(a, b, alternative="two-sided")
     return p
+
+
+def json_safe(obj: object) -> object:
+    """numpy 스칼라는 파이썬 값으로, NaN 은 None 으로 바꿔 엄격한 JSON 으로 직렬화할 수 있게 한다."""
+    if isinstance(obj, dict):
+        return {k: json_safe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [json_safe(v) for v in obj]
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float) and math.isnan(obj):
+        return None
+    return obj
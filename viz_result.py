@@ -1,17 +1,26 @@
+from functools import lru_cache
 from pathlib import Path
 
-import matplotlib
-matplotlib.rcParams["font.family"] = ["Malgun Gothic", "DejaVu Sans"]
-matplotlib.rcParams["font.sans-serif"] = ["Malgun Gothic", "DejaVu Sans"]
-matplotlib.rcParams["axes.unicode_minus"] = False
-import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
 
 from utils import add_features, load_merged
 
 
+@lru_cache(maxsize=None)
+def _plotting():
+    # matplotlib/seaborn 은 import 비용이 커서 첫 그래프를 그릴 때 불러온다
+    import matplotlib
+    matplotlib.rcParams["font.family"] = ["Malgun Gothic", "DejaVu Sans"]
+    matplotlib.rcParams["font.sans-serif"] = ["Malgun Gothic", "DejaVu Sans"]
+    matplotlib.rcParams["axes.unicode_minus"] = False
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    return plt, sns
+
+
 def plot_price_vs_sentiment(df: pd.DataFrame, out_dir: Path) -> None:
+    plt, sns = _plotting()
     plt.figure(figsize=(6, 4))
     sns.scatterplot(data=df, x="release_price", y="positive_ratio", hue="price_bucket")
     plt.title("Q1: 가격 vs 평점 (산점)")
@@ -24,6 +33,7 @@ def plot_price_vs_sentiment(df: pd.DataFrame, out_dir: Path) -> None:
 
 
 def plot_review_velocity(df: pd.DataFrame, out_dir: Path) -> None:
+    plt, sns = _plotting()
     plt.figure(figsize=(6, 4))
     sns.histplot(df["reviews_per_day_90d"].dropna(), bins=30, kde=True)
     plt.title("Q2: 리뷰 속도 분포 (90일)")
@@ -35,6 +45,7 @@ def plot_review_velocity(df: pd.DataFrame, out_dir: Path) -> None:
 
 
 def plot_engagement(df: pd.DataFrame, out_dir: Path) -> None:
+    plt, sns = _plotting()
     plt.figure(figsize=(6, 4))
     sns.boxplot(data=df, x="price_bucket", y="engagement_ratio")
     plt.yscale("log")
@@ -48,6 +59,7 @@ def plot_engagement(df: pd.DataFrame, out_dir: Path) -> None:
 
 
 def plot_price_effect(df: pd.DataFrame, out_dir: Path) -> None:
+    plt, sns = _plotting()
     plt.figure(figsize=(6, 4))
     sns.regplot(data=df, x="log_price", y="positive_ratio", scatter_kws={"alpha": 0.3}, line_kws={"color": "red"})
     plt.title("Q4: 가격(Log) vs 평점")
@@ -60,6 +72,7 @@ def plot_price_effect(df: pd.DataFrame, out_dir: Path) -> None:
 
 
 def plot_playtime_effect(df: pd.DataFrame, out_dir: Path) -> None:
+    plt, sns = _plotting()
     if "avg_playtime" not in df.columns:
         return
     subset = df[df["avg_playtime"].notna() & df["positive_ratio"].notna()]
@@ -78,6 +91,7 @@ def plot_playtime_effect(df: pd.DataFrame, out_dir: Path) -> None:
 
 
 def plot_scale_effect(df: pd.DataFrame, out_dir: Path) -> None:
+    plt, sns = _plotting()
     if "owners_median" not in df.columns:
         return
     subset = df[df["owners_median"].notna() & df["positive_ratio"].notna()]
@@ -96,6 +110,7 @@ def plot_scale_effect(df: pd.DataFrame, out_dir: Path) -> None:
 
 
 def plot_price_buckets(df: pd.DataFrame, out_dir: Path) -> None:
+    plt, sns = _plotting()
     plt.figure(figsize=(6, 4))
     sns.barplot(data=df, x="price_bucket", y="positive_ratio", estimator="mean", errorbar=None)
     plt.title("Q1: 가격 버킷별 평균 평점")
@@ -119,6 +134,7 @@ def plot_price_buckets(df: pd.DataFrame, out_dir: Path) -> None:
 
 
 def plot_speed_vs_sentiment(df: pd.DataFrame, out_dir: Path) -> None:
+    plt, sns = _plotting()
     if "reviews_per_day_90d" not in df.columns:
         return
     subset = df[df["reviews_per_day_90d"].notna() & df["positive_ratio"].notna()]